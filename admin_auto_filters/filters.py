@@ -1,13 +1,28 @@
+import functools
+import hashlib
+import operator
+import weakref
+
 from django.contrib.admin.widgets import AutocompleteSelect as Base
 from django import forms
 from django.contrib import admin
+from django.core.cache import cache
 from django.db.models import ForeignObjectRel
 from django.db.models.constants import LOOKUP_SEP  # this is '__'
 from django.db.models.fields.related_descriptors import ReverseManyToOneDescriptor, ManyToManyDescriptor
 from django.forms.widgets import Media, MEDIA_TYPES, media_property
 from django.shortcuts import reverse
+from django.utils.functional import cached_property
+from django.utils.safestring import mark_safe
+from django.utils.translation import get_language
 from django import VERSION as DJANGO_VERSION
 
+# tracks which (filter class, widget class) pairs have already had their
+# media merged into a given model admin class, so the merge runs once per
+# process instead of once per request
+_installed_media = weakref.WeakKeyDictionary()
+
+
 class AutocompleteSelect(Base):
     def __init__(self, rel, admin_site, attrs=None, choices=(), using=None, custom_url=None):
         self.custom_url = custom_url
@@ -17,6 +32,56 @@ class AutocompleteSelect(Base):
         return self.custom_url if self.custom_url else super().get_url()
 
 
+@functools.lru_cache(maxsize=256)
+def _get_cached_widget(filter_class, remote_field, admin_site):
+    """
+    Share AutocompleteSelect instances on the default (no custom url) path,
+    where the widget holds no per-request state until render() supplies the
+    name/value/attrs. Keyed per filter class so filters with different form
+    fields never exchange widget state.
+    """
+    return AutocompleteSelect(remote_field, admin_site)
+
+
+@functools.lru_cache(maxsize=512)
+def _resolve_remote_field(model, name):
+    """
+    Look up the remote field (or the field itself on Django 3.2+) used to
+    build the autocomplete widget. Cached because the result depends only on
+    the model class and field name, yet was walked via _meta every request.
+    """
+    if DJANGO_VERSION >= (3, 2):
+        return model._meta.get_field(name)
+    return model._meta.get_field(name).remote_field
+
+
+@functools.lru_cache(maxsize=512)
+def _resolve_related_model(model, name):
+    """
+    Resolve the target behind a field name on a model, returning either
+    ('model', related_model) or ('qs_callable', get_queryset) depending on
+    the descriptor type. The mapping is static per process, so it is cached
+    to avoid repeating the descriptor and _meta lookups on every request.
+    """
+    try:
+        field_desc = getattr(model, name)
+    except AttributeError:
+        field_desc = model._meta.get_field(name)
+    if isinstance(field_desc, ManyToManyDescriptor):
+        related_model = field_desc.rel.related_model if field_desc.reverse else field_desc.rel.model
+    elif isinstance(field_desc, ReverseManyToOneDescriptor):
+        related_model = field_desc.rel.related_model  # look at field_desc.related_manager_cls()?
+    elif isinstance(field_desc, ForeignObjectRel):
+        # includes ManyToOneRel, ManyToManyRel
+        # also includes OneToOneRel - not sure how this would be used
+        related_model = field_desc.related_model
+    else:
+        # primarily for ForeignKey/ForeignKeyDeferredAttribute
+        # also includes ForwardManyToOneDescriptor, ForwardOneToOneDescriptor, ReverseOneToOneDescriptor
+        return 'qs_callable', field_desc.get_queryset
+    return 'model', related_model
+
+
 class AutocompleteFilter(admin.SimpleListFilter):
     template = 'django-admin-autocomplete-filter/autocomplete-filter.html'
     title = ''
@@ -28,6 +93,9 @@ class AutocompleteFilter(admin.SimpleListFilter):
     rel_model = None
     parameter_name = None
     form_field = forms.ModelChoiceField
+    select_related_fields = ()
+    prefetch_related_fields = ()
+    cache_timeout = None
 
     class Media:
         js = (
@@ -42,79 +110,188 @@ class AutocompleteFilter(admin.SimpleListFilter):
 
     def __init__(self, request, params, model, model_admin):
         if self.parameter_name is None:
-            self.parameter_name = self.field_name
-            if self.use_pk_exact:
-                self.parameter_name += '__{}__exact'.format(self.field_pk)
+            self.parameter_name = self.get_parameter_name()
         super().__init__(request, params, model, model_admin)
 
         if self.rel_model:
             model = self.rel_model
 
-        if DJANGO_VERSION >= (3, 2):
-            remote_field = model._meta.get_field(self.field_name)
-        else:
-            remote_field = model._meta.get_field(self.field_name).remote_field
+        remote_field = _resolve_remote_field(model, self.field_name)
 
-        widget = AutocompleteSelect(remote_field,
-                                    model_admin.admin_site,
-                                    custom_url=self.get_autocomplete_url(request, model_admin),)
+        custom_url = self.get_autocomplete_url(request, model_admin)
+        if custom_url is None:
+            widget = _get_cached_widget(type(self), remote_field, model_admin.admin_site)
+        else:
+            widget = AutocompleteSelect(remote_field,
+                                        model_admin.admin_site,
+                                        custom_url=custom_url,)
+        self._model = model
+        self._widget = widget
+
+        self._add_media(request, model_admin, widget)
+
+    @cached_property
+    def rendered_widget(self):
+        """Render the widget HTML lazily, on first template access, so admin
+        views that never paint the filter sidebar skip the render cost. With
+        cache_timeout set, the HTML is also cached across requests; expiry is
+        the only invalidation, so label changes propagate on the timeout."""
+        cache_timeout = self.cache_timeout
+        if cache_timeout is None:
+            return self._render_widget()
+        key = self._render_cache_key()
+        html = cache.get(key)
+        if html is None:
+            html = str(self._render_widget())
+            cache.set(key, html, cache_timeout)
+        return mark_safe(html)
+
+    def _render_cache_key(self):
+        """
+        Build the cache key from everything that shapes the rendered HTML:
+        the filter class, parameter name, autocomplete url, related model,
+        title, form field (with its label source) and the selected value.
+        Factory-generated classes all share a __qualname__, so the class name
+        alone cannot distinguish them. The variable parts are hashed to keep
+        the key within backend length/character limits.
+        """
+        cls = type(self)
+        form_field = self.get_form_field()
+        label_item = getattr(form_field, 'label_item', None)
+        if callable(label_item):
+            label_item = f'{getattr(label_item, "__module__", "")}.{getattr(label_item, "__qualname__", "")}'
+        parts = (
+            self.parameter_name,
+            self.field_name,
+            self._widget.get_url(),
+            f'{self._model.__module__}.{self._model.__qualname__}',
+            self.title,
+            f'{form_field.__module__}.{form_field.__qualname__}',
+            label_item,
+            self._prepared_value,
+        )
+        hashed = hashlib.md5(':'.join(str(part) for part in parts).encode()).hexdigest()
+        return f'daaf:{cls.__module__}.{cls.__qualname__}:{hashed}'
+
+    def _render_widget(self):
+        parameter_name = self.parameter_name
+        queryset = self.get_queryset_for_field(self._model, self.field_name)
+        if self.select_related_fields:
+            queryset = queryset.select_related(*self.select_related_fields)
+        if self.prefetch_related_fields:
+            queryset = queryset.prefetch_related(*self.prefetch_related_fields)
         form_field = self.get_form_field()
         field = form_field(
-            queryset=self.get_queryset_for_field(model, self.field_name),
-            widget=widget,
+            queryset=queryset,
+            widget=self._widget,
             required=False,
         )
-
-        self._add_media(model_admin, widget)
-
-        attrs = self.widget_attrs.copy()
-        attrs['id'] = 'id-%s-dal-filter' % self.parameter_name
-        if self.is_placeholder_title:
-            # Upper case letter P as dirty hack for bypass django2 widget force placeholder value as empty string ("")
-            attrs['data-Placeholder'] = self.title
-        self.rendered_widget = field.widget.render(
-            name=self.parameter_name,
-            value=self.used_parameters.get(self.parameter_name, ''),
-            attrs=attrs
+        value = self._prepared_value
+        return field.widget.render(
+            name=parameter_name,
+            value='' if value is None else value,
+            attrs=self.get_attrs()
         )
 
+    @cached_property
+    def _prepared_value(self):
+        """The usable filter value, or None when absent or blank. Cached so
+        queryset() and the widget render share a single normalization pass."""
+        value = self.value()
+        if not value or (isinstance(value, str) and not value.strip()):
+            # blank values are "no selection" - don't let them reach the
+            # database or the widget's value resolution
+            return None
+        return value
+
+    @classmethod
+    def get_parameter_name(cls):
+        """
+        Derive the parameter name from field_name, caching the result in the
+        class __dict__ (not on parameter_name itself, which subclasses would
+        inherit) so the string work happens once per concrete class.
+        """
+        if cls.parameter_name is not None:
+            return cls.parameter_name
+        derived = cls.__dict__.get('_derived_parameter_name')
+        if derived is None:
+            derived = cls.field_name
+            if cls.use_pk_exact:
+                derived += f'__{cls.field_pk}__exact'
+            cls._derived_parameter_name = derived
+        return derived
+
     @staticmethod
     def get_queryset_for_field(model, name):
-        try:
-            field_desc = getattr(model, name)
-        except AttributeError:
-            field_desc = model._meta.get_field(name)
-        if isinstance(field_desc, ManyToManyDescriptor):
-            related_model = field_desc.rel.related_model if field_desc.reverse else field_desc.rel.model
-        elif isinstance(field_desc, ReverseManyToOneDescriptor):
-            related_model = field_desc.rel.related_model  # look at field_desc.related_manager_cls()?
-        elif isinstance(field_desc, ForeignObjectRel):
-            # includes ManyToOneRel, ManyToManyRel
-            # also includes OneToOneRel - not sure how this would be used
-            related_model = field_desc.related_model
-        else:
-            # primarily for ForeignKey/ForeignKeyDeferredAttribute
-            # also includes ForwardManyToOneDescriptor, ForwardOneToOneDescriptor, ReverseOneToOneDescriptor
-            return field_desc.get_queryset()
-        return related_model.objects.get_queryset()
+        kind, target = _resolve_related_model(model, name)
+        if kind == 'model':
+            return target.objects.get_queryset()
+        return target()
 
     def get_form_field(self):
         """Return the type of form field to be used."""
         return self.form_field
 
-    def _add_media(self, model_admin, widget):
-
-        if not hasattr(model_admin, 'Media'):
-            model_admin.__class__.Media = type('Media', (object,), dict())
-            model_admin.__class__.media = media_property(model_admin.__class__)
-
-        def _get_media(obj):
-            return Media(media=getattr(obj, 'Media', None))
-
-        media = _get_media(model_admin) + widget.media + _get_media(AutocompleteFilter) + _get_media(self)
+    @classmethod
+    def _build_base_attrs(cls):
+        """Bind the static widget attrs (widget_attrs plus the id) into the
+        class __dict__ so hot-path reads are plain attribute loads."""
+        base_attrs = dict(cls.widget_attrs)
+        base_attrs['id'] = f'id-{cls.get_parameter_name()}-dal-filter'
+        cls._base_attrs = base_attrs
+        return base_attrs
+
+    def get_attrs(self):
+        """Return the HTML attributes for the widget."""
+        cls = type(self)
+        base_attrs = cls.__dict__.get('_base_attrs')
+        if base_attrs is None:
+            base_attrs = cls._build_base_attrs()
+        attrs = dict(base_attrs)
+        if self.is_placeholder_title:
+            # Upper case letter P as dirty hack for bypass django2 widget force placeholder value as empty string ("")
+            attrs['data-Placeholder'] = self.title
+        return attrs
+
+    def _add_media(self, request, model_admin, widget):
+        # widget.media is language-dependent (it picks the select2 i18n file
+        # for the active language), so the gates key on the language too and
+        # each locale gets its file merged in once
+        key = (type(self), type(widget), get_language())
+
+        # request-scoped short-circuit: only the first filter of a given
+        # class on a page needs to look at the process-level registry
+        done = getattr(request, '_daaf_media_done', None)
+        if done is None:
+            done = set()
+            request._daaf_media_done = done
+        if key in done:
+            return
+        done.add(key)
+
+        admin_class = model_admin.__class__
+        installed = _installed_media.setdefault(admin_class, set())
+        if key in installed:
+            return
+
+        if 'Media' not in admin_class.__dict__:
+            # Give the admin class its own Media - either a fresh one, or a
+            # subclass of the inherited one so the merge below does not
+            # mutate a parent admin class's Media.
+            bases = (admin_class.Media,) if hasattr(admin_class, 'Media') else (object,)
+            admin_class.Media = type('Media', bases, dict())
+            admin_class.media = media_property(admin_class)
+
+        media = (
+            Media(media=getattr(model_admin, 'Media', None))
+            + widget.media
+            + Media(media=getattr(AutocompleteFilter, 'Media', None))
+            + Media(media=getattr(self, 'Media', None))
+        )
 
         for name in MEDIA_TYPES:
             setattr(model_admin.Media, name, getattr(media, "_" + name))
+        installed.add(key)
 
     def has_output(self):
         return True
@@ -123,10 +300,10 @@ class AutocompleteFilter(admin.SimpleListFilter):
         return ()
 
     def queryset(self, request, queryset):
-        if self.value():
-            return queryset.filter(**{self.parameter_name: self.value()})
-        else:
+        value = self._prepared_value
+        if value is None:
             return queryset
+        return queryset.filter(**{self.parameter_name: value})
     
     def get_autocomplete_url(self, request, model_admin):
         '''
@@ -136,41 +313,81 @@ class AutocompleteFilter(admin.SimpleListFilter):
         return None
 
 
+class LabelledModelChoiceField(forms.ModelChoiceField):
+    """
+    A ModelChoiceField with label_from_instance driven by the label_item
+    class attribute, which can be a callable, or a model field, or a model
+    callable.
+    """
+    label_item = None
+    _label_fn = None
+
+    def label_from_instance(self, obj):
+        label_fn = self._label_fn
+        if label_fn is None:
+            label_fn = self._label_fn = self._resolve_label_fn(type(obj))
+        return label_fn(obj)
+
+    def _resolve_label_fn(self, model):
+        """
+        Resolve label_item into a single callable, once per field, so the
+        per-choice loop avoids redoing the callable/hasattr/getattr checks
+        for every rendered option.
+        """
+        label_item = self.label_item
+        if callable(label_item):
+            return label_item
+        name = str(label_item)
+        if hasattr(model, name):
+            if callable(getattr(model, name)):
+                return operator.methodcaller(name)
+            return operator.attrgetter(name)
+
+        def label_fn(obj):
+            # per-instance dispatch for attributes not visible on the class
+            if hasattr(obj, name):
+                attr = getattr(obj, name)
+                return attr() if callable(attr) else attr
+            raise ValueError(f'Invalid label_item specified: {name}')
+        return label_fn
+
+
+@functools.lru_cache(maxsize=None)
 def generate_choice_field(label_item):
     """
     Create a ModelChoiceField variant with a modified label_from_instance.
     Note that label_item can be a callable, or a model field, or a model callable.
+    The class is cached per label_item so repeated filter instantiations share it.
     """
-    class LabelledModelChoiceField(forms.ModelChoiceField):
-        def label_from_instance(self, obj):
-            if callable(label_item):
-                value = label_item(obj)
-            elif hasattr(obj, str(label_item)):
-                attr = getattr(obj, label_item)
-                if callable(attr):
-                    value = attr()
-                else:
-                    value = attr
-            else:
-                raise ValueError('Invalid label_item specified: %s' % str(label_item))
-            return value
-    return LabelledModelChoiceField
+    if callable(label_item):
+        label_item = staticmethod(label_item)
+    return type('LabelledModelChoiceField', (LabelledModelChoiceField,),
+                {'label_item': label_item})
 
 
-def _get_rel_model(model, parameter_name):
+@functools.lru_cache(maxsize=512)
+def _get_rel_model_from_parts(model, field_parts):
     """
-    A way to calculate the model for a parameter_name that includes LOOKUP_SEP.
+    Calculate the model for an already-split parameter name, walking the
+    relation chain. Cached since the walk over _meta is static per
+    (model, field_parts).
     """
-    field_names = str(parameter_name).split(LOOKUP_SEP)
-    if len(field_names) == 1:
+    if len(field_parts) == 1:
         return None
     else:
         rel_model = model
-        for name in field_names[:-1]:
+        for name in field_parts[:-1]:
             rel_model = rel_model._meta.get_field(name).related_model
         return rel_model
 
 
+def _get_rel_model(model, parameter_name):
+    """
+    A way to calculate the model for a parameter_name that includes LOOKUP_SEP.
+    """
+    return _get_rel_model_from_parts(model, tuple(str(parameter_name).split(LOOKUP_SEP)))
+
+
 def AutocompleteFilterFactory(title, base_parameter_name, viewname='', use_pk_exact=False, label_by=str):
     """
     An autocomplete widget filter with a customizable title. Use like this:
@@ -186,24 +403,27 @@ def AutocompleteFilterFactory(title, base_parameter_name, viewname='', use_pk_ex
           of a model callable, or the name of a model field.
     """
 
+    field_parts = tuple(str(base_parameter_name).split(LOOKUP_SEP))
+
     class NewMetaFilter(type(AutocompleteFilter)):
         """A metaclass for an autogenerated autocomplete filter class."""
 
         def __new__(cls, name, bases, attrs):
             super_new = super().__new__(cls, name, bases, attrs)
             super_new.use_pk_exact = use_pk_exact
-            field_names = str(base_parameter_name).split(LOOKUP_SEP)
-            super_new.field_name = field_names[-1]
+            super_new._field_parts = field_parts
+            super_new.field_name = field_parts[-1]
             super_new.parameter_name = base_parameter_name
-            if len(field_names) <= 1 and super_new.use_pk_exact:
-                super_new.parameter_name += '__{}__exact'.format(super_new.field_pk)
+            if len(field_parts) <= 1 and super_new.use_pk_exact:
+                super_new.parameter_name += f'__{super_new.field_pk}__exact'
+            super_new._build_base_attrs()
             return super_new
 
     class NewFilter(AutocompleteFilter, metaclass=NewMetaFilter):
         """An autogenerated autocomplete filter class."""
 
         def __init__(self, request, params, model, model_admin):
-            self.rel_model = _get_rel_model(model, base_parameter_name)
+            self.rel_model = _get_rel_model_from_parts(model, self._field_parts)
             self.form_field = generate_choice_field(label_by)
             super().__init__(request, params, model, model_admin)
             self.title = title
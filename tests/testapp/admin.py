@@ -47,6 +47,7 @@ class FriendFilter(AutocompleteFilter):
     field_name = 'best_friend'
     rel_model = Person
     parameter_name = 'best_friend'
+    select_related_fields = ('favorite_food',)
 
 
 class TwinFilter(AutocompleteFilter):
@@ -115,6 +115,37 @@ class RootTestCase(object):
                         html=True, msg_prefix=str(url)
                     )
 
+    def test_admin_changelist_blank_filter_value(self):
+        """
+        Test that a whitespace-only filter value leaves the changelist unfiltered.
+        """
+        url = reverse('admin:testapp_person_changelist') + '?best_friend=%20'
+        response = self.client.get(url, follow=False)
+        self.assertEqual(response.status_code, 200, msg=str(url))
+        all_pks = set(flatten(list(Person.objects.values_list('pk'))))
+        for pk in all_pks:
+            self.assertContains(
+                response, '<td class="field-id">%s</td>' % pk,
+                html=True, msg_prefix=str(url)
+            )
+
+    def test_get_parameter_name_not_inherited(self):
+        """
+        Test that a derived parameter_name is cached per concrete class and
+        not leaked to subclasses that override only field_name.
+        """
+        class BaseF(filters.AutocompleteFilter):
+            field_name = 'best_friend'
+
+        class ChildF(BaseF):
+            field_name = 'favorite_food'
+
+        # deriving the parent's name first must not poison the child
+        self.assertEqual(BaseF.get_parameter_name(), 'best_friend__pk__exact')
+        self.assertEqual(ChildF.get_parameter_name(), 'favorite_food__pk__exact')
+        self.assertIsNone(BaseF.parameter_name)
+        self.assertIsNone(ChildF.parameter_name)
+
     def test_get_queryset_for_field(self):
         """
         Test the AutocompleteFilter.get_queryset_for_field method.
@@ -123,6 +154,7 @@ class RootTestCase(object):
             def __init__(self, *args, **kwargs):
                 pass
         f = TestFilter()
+        filters._resolve_related_model.cache_clear()
         self.assertRaises(exceptions.FieldDoesNotExist,
                           f.get_queryset_for_field, Person, 'not_a_field')
         self.assertRaises(AttributeError,
@@ -138,6 +170,10 @@ class RootTestCase(object):
             qs = f.get_queryset_for_field(Book, 'people_with_this_fav_book')
         except BaseException as e:
             self.fail(str(e))
+        # repeated lookups for the same (model, name) should hit the cache
+        hits = filters._resolve_related_model.cache_info().hits
+        f.get_queryset_for_field(Person, 'best_friend')
+        self.assertEqual(filters._resolve_related_model.cache_info().hits, hits + 1)
 
 
 @tag('basic')
@@ -145,6 +181,42 @@ class BasicTestCase(RootTestCase, TestCase):
     def setUp(self):
         self.client.force_login(self.basic_user)
 
+    def test_rendered_widget_cache(self):
+        """
+        Test that setting cache_timeout caches the rendered widget HTML, and
+        that filters with different render inputs do not share a cache key.
+        """
+        from django.contrib import admin
+        from django.core.cache import cache
+        from django.test import RequestFactory
+        from admin_auto_filters.filters import AutocompleteFilterFactory
+        from tests.testapp.admin import FriendFilter
+
+        cache.clear()
+        request = RequestFactory().get('/admin/testapp/person/')
+        model_admin = admin.site._registry[Person]
+        try:
+            FriendFilter.cache_timeout = 60
+            f = FriendFilter(request, {'best_friend': '1'}, Person, model_admin)
+            key = f._render_cache_key()
+            self.assertIsNone(cache.get(key))
+            html = f.rendered_widget
+            self.assertEqual(cache.get(key), str(html))
+
+            # factory classes share a __qualname__ - filters on the same
+            # parameter name with a different endpoint or label source must
+            # still get distinct keys
+            plain = AutocompleteFilterFactory('food (auto)', 'favorite_food')
+            custom = AutocompleteFilterFactory(
+                'food (auto)', 'favorite_food',
+                viewname='admin:foods_that_are_favorites', label_by='alternate_name')
+            f_plain = plain(request, {'favorite_food': '3'}, Person, model_admin)
+            f_custom = custom(request, {'favorite_food': '3'}, Person, model_admin)
+            self.assertNotEqual(f_plain._render_cache_key(), f_custom._render_cache_key())
+        finally:
+            FriendFilter.cache_timeout = None
+            cache.clear()
+
 
 @tag('shortcut')
 class ShortcutTestCase(RootTestCase, TestCase):